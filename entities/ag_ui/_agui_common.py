@@ -0,0 +1,91 @@
+"""Shared tools, agent and FastAPI app setup for the AG-UI travel servers.
+
+The server entry points only differ in how they authenticate and which chat
+client they use, so everything else lives here and is defined once.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, Any, Final
+
+from agent_framework import ChatAgent, tool
+from pydantic import Field
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+# Simulated weather data, built once at import rather than per tool call
+_WEATHER: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+    "Seattle": {"temp": 18, "condition": "Cloudy", "humidity": 75},
+    "San Francisco": {"temp": 22, "condition": "Sunny", "humidity": 60},
+    "New York": {"temp": 25, "condition": "Partly cloudy", "humidity": 65},
+    "London": {"temp": 15, "condition": "Rainy", "humidity": 85},
+})
+_DEFAULT_WEATHER: Final[Mapping[str, Any]] = MappingProxyType({"temp": 20, "condition": "Unknown", "humidity": 50})
+_WEATHER_TEMPLATE: Final = "Weather in {location}: {condition}, {temp}°C, {humidity}% humidity"
+
+# Define function tools
+@tool
+def get_weather(
+    location: Annotated[str, Field(description="The city to get weather for")],
+) -> str:
+    """Get the current weather for a location."""
+    data = _WEATHER.get(location, _DEFAULT_WEATHER)
+    return _WEATHER_TEMPLATE.format_map({"location": location, **data})
+
+
+@tool
+def search_restaurants(
+    location: Annotated[str, Field(description="The city to search in")],
+    cuisine: Annotated[str, Field(description="Type of cuisine")] = "any",
+) -> dict[str, Any]:
+    """Search for restaurants in a location."""
+    return {
+        "location": location,
+        "cuisine": cuisine,
+        "results": [
+            {"name": "The Golden Fork", "cuisine": cuisine if cuisine != "any" else "Italian", "rating": 4.5, "price": "$$"},
+            {"name": "Spice Haven", "cuisine": "Indian", "rating": 4.7, "price": "$$"},
+            {"name": "Green Leaf", "cuisine": "Vegetarian", "rating": 4.3, "price": "$"},
+        ]
+    }
+
+
+# Decorated once at import; every agent created below reuses these tool objects
+TRAVEL_TOOLS: Final = (get_weather, search_restaurants)
+
+
+def create_agent(chat_client) -> ChatAgent:
+    """Create the travel assistant agent on top of the given chat client."""
+    return ChatAgent(
+        name="TravelAssistant",
+        instructions="""You are a helpful travel assistant. Use the available tools to help users:
+        - Check weather conditions at destinations
+        - Find restaurants by location and cuisine type
+
+        Be friendly and provide helpful recommendations based on the data you gather.""",
+        chat_client=chat_client,
+        tools=list(TRAVEL_TOOLS),
+    )
+
+
+def build_app(agent: ChatAgent | None) -> "FastAPI":
+    """Create the FastAPI app with CORS, serving the agent when one is given."""
+    from agent_framework_ag_ui import add_agent_framework_fastapi_endpoint
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+
+    # Create FastAPI app with CORS for web clients
+    app = FastAPI(title="AG-UI Travel Assistant")
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Register the AG-UI endpoint (only if agent is configured)
+    if agent:
+        add_agent_framework_fastapi_endpoint(app, agent, "/")
+    return app
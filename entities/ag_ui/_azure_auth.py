@@ -0,0 +1,40 @@
+"""Shared Azure credentials for the AG-UI server modules.
+
+Each credential runs its own token cache and refresh logic, so the server
+modules share a single instance per process instead of creating their own.
+AzureAIAgentClient takes an async credential, while AzureOpenAIChatClient
+calls get_token() synchronously, so one of each kind is kept.
+The Azure SDK imports are deferred until a credential is actually needed, so
+importing a server module for discovery stays cheap.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from azure.identity import AzureCliCredential
+    from azure.identity.aio import DefaultAzureCredential
+
+_credential: DefaultAzureCredential | None = None
+_sync_credential: AzureCliCredential | None = None
+
+
+def get_credential() -> DefaultAzureCredential:
+    """Return the process-wide DefaultAzureCredential, creating it on first use."""
+    global _credential
+    if _credential is None:
+        from azure.identity.aio import DefaultAzureCredential
+        
+        _credential = DefaultAzureCredential()
+    return _credential
+
+
+def get_sync_credential() -> AzureCliCredential:
+    """Return the process-wide sync AzureCliCredential, creating it on first use."""
+    global _sync_credential
+    if _sync_credential is None:
+        from azure.identity import AzureCliCredential
+        
+        _sync_credential = AzureCliCredential()
+    return _sync_credential
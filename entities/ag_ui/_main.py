@@ -6,14 +6,17 @@ AI Toolkit Agent Inspector and production deployments.
 """
 
 import os
-from typing import Annotated
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Annotated, Final
 
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureAIAgentClient
-from azure.identity.aio import DefaultAzureCredential
 from dotenv import load_dotenv
 from pydantic import Field
 
+from _azure_auth import get_credential
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -24,6 +27,14 @@ if not PROJECT_ENDPOINT or PROJECT_ENDPOINT.startswith("https://<"):
     raise ValueError("Please set PROJECT_ENDPOINT in your .env file (copy from .env.sample)")
 
 
+# Simulated metrics data, built once at import rather than per tool call
+_METRICS: Final[Mapping[str, Mapping[str, float]]] = MappingProxyType({
+    "vm-prod-01": {"cpu": 78.5, "memory": 62.3, "disk": 45.0, "network_in": 125.6},
+    "vm-prod-02": {"cpu": 23.1, "memory": 41.2, "disk": 72.8, "network_in": 89.3},
+    "vm-db-01": {"cpu": 91.2, "memory": 88.5, "disk": 55.0, "network_in": 234.1},
+})
+
+
 # Define the SRE tool using type hints
 def get_system_metrics(
     server_name: Annotated[str, Field(description="The name of the server (e.g., vm-prod-01, vm-db-01)")],
@@ -33,19 +44,13 @@ def get_system_metrics(
     Retrieves current system metrics (CPU, memory, disk, network) for a specified server.
     Use this to diagnose performance issues.
     """
-    # Simulated metrics data
-    metrics_data = {
-        "vm-prod-01": {"cpu": 78.5, "memory": 62.3, "disk": 45.0, "network_in": 125.6},
-        "vm-prod-02": {"cpu": 23.1, "memory": 41.2, "disk": 72.8, "network_in": 89.3},
-        "vm-db-01": {"cpu": 91.2, "memory": 88.5, "disk": 55.0, "network_in": 234.1},
-    }
-
-    server = metrics_data.get(server_name, {})
+    server = _METRICS.get(server_name, {})
     if not server:
         return {"error": f"Server {server_name} not found"}
 
     if metric_type == "all":
-        return {"server": server_name, "metrics": server}
+        # Copy so callers never receive (or mutate) the shared table
+        return {"server": server_name, "metrics": dict(server)}
 
     value = server.get(metric_type)
     if value is None:
@@ -59,8 +64,8 @@ def get_system_metrics(
     }
 
 
-# Initialize credential for Azure RBAC authentication
-credential = DefaultAzureCredential()
+# Shared credential for Azure RBAC authentication
+credential = get_credential()
 
 # Create the Azure AI Agent Client
 chat_client = AzureAIAgentClient(
@@ -1,11 +1,47 @@
 """AG-UI client with tool event handling."""
 
 import asyncio
+import contextlib
 import os
+import sys
 
 from agent_framework import ChatAgent, ToolCallContent, ToolResultContent
 from agent_framework_ag_ui import AGUIChatClient
 
+
+class BufferedWriter:
+    """Collects streamed text and writes it to stdout in batches.
+
+    Flushes on newline or once the buffer passes ``max_chars``, so fast token
+    streams cost one write syscall per batch instead of one per update.
+    """
+
+    def __init__(self, max_chars: int = 256):
+        self.max_chars = max_chars
+        self._parts: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size > self.max_chars or "\n" in text:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            sys.stdout.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+            sys.stdout.flush()
+
+
+async def periodic_flush(writer: BufferedWriter, interval: float = 0.05) -> None:
+    """Flush the writer every ``interval`` seconds so slow streams still show up."""
+    while True:
+        await asyncio.sleep(interval)
+        writer.flush()
+
+
 async def main():
     """Main client loop with tool event display."""
     server_url = os.environ.get("AGUI_SERVER_URL", "http://127.0.0.1:8888/")
@@ -34,18 +70,26 @@ async def main():
                 break
 
             print("\nAssistant: ", end="", flush=True)
-            async for update in agent.run_stream(message, thread=thread):
-                # Display text content (cyan)
-                if update.text:
-                    print(f" [96m{update.text} [0m", end="", flush=True)
-
-                # Display tool calls and results
-                for content in update.contents:
-                    if isinstance(content, ToolCallContent):
-                        print(f"\n[95m[Calling tool: {content.name}] [0m")
-                    elif isinstance(content, ToolResultContent):
-                        result_text = content.result if isinstance(content.result, str) else str(content.result)
-                        print(f"\n[94m[Tool result: {result_text[:100]}...] [0m")
+            writer = BufferedWriter()
+            flusher = asyncio.create_task(periodic_flush(writer))
+            try:
+                async for update in agent.run_stream(message, thread=thread):
+                    # Display text content (cyan)
+                    if update.text:
+                        writer.write(f" [96m{update.text} [0m")
+
+                    # Display tool calls and results
+                    for content in update.contents:
+                        if isinstance(content, ToolCallContent):
+                            writer.write(f"\n[95m[Calling tool: {content.name}] [0m\n")
+                        elif isinstance(content, ToolResultContent):
+                            result_text = content.result if isinstance(content.result, str) else str(content.result)
+                            writer.write(f"\n[94m[Tool result: {result_text[:100]}...] [0m\n")
+            finally:
+                flusher.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await flusher
+                writer.flush()
             print("\n")
 
     except KeyboardInterrupt:
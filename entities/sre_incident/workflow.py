@@ -9,24 +9,31 @@ This workflow automates incident response with:
 4. Teams Notification - Posts to incident channel (simulated)
 5. Final Report - Summarizes actions taken
 
+By default the steps run inside a single fused executor; set WORKFLOW_DEBUG=1
+to run them as separate executors for step-wise tracing in DevUI.
+
+Triage results for sev3/sev4 alerts are cached by alert fingerprint, so
+repeat alerts skip straight from Alert Processing to GitHub Issue Creation.
+GitHub Issue Creation and Teams Notification only depend on the triage, so
+they run concurrently and the Final Report joins both.
+
 For demo purposes, GitHub and Teams integrations are simulated.
 In production, these would use actual MCP servers.
+
+Set SRE_DEMO_DELAY=1 to restore the simulated processing delays, which make
+each step easier to follow in DevUI.
 """
 
 import asyncio
+import itertools
 import json
 import logging
+import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Literal
-
-# Optional: Set up OpenTelemetry tracing for AI Toolkit
-# Uncomment the following lines if you have opentelemetry-exporter-otlp-proto-grpc installed
-# from agent_framework.observability import configure_otel_providers
-# configure_otel_providers(
-#     vs_code_extension_port=4317,  # AI Toolkit gRPC port
-#     enable_sensitive_data=True  # Enable capturing prompts and completions
-# )
+from enum import IntEnum
+from typing import Callable, Literal
 
 from agent_framework import (
     Case,
@@ -37,10 +44,58 @@ from agent_framework import (
     handler,
     response_handler,
 )
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import Never
 
 
+# Simulated processing delays are opt-in; by default each step only yields
+# control back to the event loop.
+DEMO_DELAY = os.getenv("SRE_DEMO_DELAY") == "1"
+
+
+async def simulate_work(seconds: float) -> None:
+    """Sleep for the given time in demo mode, otherwise just yield."""
+    await asyncio.sleep(seconds if DEMO_DELAY else 0)
+
+
+# Simulated ID allocators for GitHub issue numbers and Teams message IDs
+_ISSUE_COUNTER = itertools.count(1000)
+_MSG_COUNTER = itertools.count(1)
+
+
+class Sev(IntEnum):
+    """Incident severity, used as an index into the per-severity tables below."""
+    SEV1 = 0
+    SEV2 = 1
+    SEV3 = 2
+    SEV4 = 3
+
+
+_SEV_LABEL = ("sev1", "sev2", "sev3", "sev4")
+_PRIORITY = ("P1", "P2", "P3", "P4")
+_EMOJI = ("🔴", "🟠", "🟡", "🔵")
+_CHANNEL = ("#incident-critical", "#incident-high", "#ops-alerts", "#ops-info")
+
+_FROM_ALERT = {"critical": Sev.SEV1, "high": Sev.SEV2, "medium": Sev.SEV3, "low": Sev.SEV4}
+_FROM_LABEL = {label: Sev(i) for i, label in enumerate(_SEV_LABEL)}
+
+
+def compile_team_picker(service_teams: dict[str, str], default: str) -> Callable[[str], str]:
+    """Generate a resource -> team function with the table inlined.
+    
+    The mapping is static per process, so it is compiled once into a
+    straight-line cascade of startswith checks in table order.
+    """
+    lines = ["def pick_team(resource):"]
+    for prefix, team in service_teams.items():
+        lines.append(f"    if resource.startswith({prefix!r}): return {team!r}")
+    lines.append(f"    return {default!r}")
+    namespace: dict = {}
+    exec(compile("\n".join(lines), "<team-picker>", "exec"), namespace)
+    return namespace["pick_team"]
+
+
 # ============================================================================
 # Data Models
 # ============================================================================
@@ -48,6 +103,8 @@ from typing_extensions import Never
 class AlertInput(BaseModel):
     """Input model for incoming alerts."""
     
+    model_config = ConfigDict(frozen=True)
+    
     alert_id: str = Field(
         default="ALT-2026-0131-001",
         description="Unique alert identifier"
@@ -78,7 +135,11 @@ class AlertInput(BaseModel):
     )
 
 
-@dataclass
+# Plan cache key: (resource, severity, runbook keyword, cpu_high, memory_high)
+Fingerprint = tuple[str, str, str, bool, bool]
+
+
+@dataclass(slots=True)
 class ProcessedAlert:
     """Validated and enriched alert data."""
     alert_id: str
@@ -91,9 +152,16 @@ class ProcessedAlert:
     received_at: str
     is_valid: bool = True
     validation_errors: list[str] = field(default_factory=list)
+    # Metric thresholds, evaluated once during validation
+    cpu_high: bool = False
+    memory_high: bool = False
+    elevated_metrics: list[str] = field(default_factory=list)
+    # Runbook keyword and plan cache key, also computed once during validation
+    runbook_key: str = "default"
+    fingerprint: Fingerprint = ("", "", "default", False, False)
 
 
-@dataclass
+@dataclass(slots=True)
 class TriageResult:
     """Result of incident triage analysis."""
     alert: ProcessedAlert
@@ -107,6 +175,81 @@ class TriageResult:
     priority: str  # P1, P2, P3, P4
 
 
+@dataclass(slots=True)
+class TriageTemplate:
+    """Alert-independent part of a triage result, reusable across repeat alerts."""
+    incident_severity: str
+    affected_services: list[str]
+    recommended_actions: list[str]
+    assigned_team: str
+    runbook_url: str
+    priority: str
+
+    @classmethod
+    def from_triage(cls, triage: TriageResult) -> "TriageTemplate":
+        """Generalize a triage result by dropping the alert-specific fields."""
+        return cls(
+            incident_severity=triage.incident_severity,
+            affected_services=list(triage.affected_services),
+            recommended_actions=list(triage.recommended_actions),
+            assigned_team=triage.assigned_team,
+            runbook_url=triage.runbook_url,
+            priority=triage.priority,
+        )
+
+    def fill(self, alert: ProcessedAlert) -> TriageResult:
+        """Build a triage result for a new alert from this template."""
+        return TriageResult(
+            alert=alert,
+            incident_severity=self.incident_severity,
+            incident_title=f"[{self.incident_severity.upper()}] {alert.title}",
+            summary=summarize_alert(alert),
+            affected_services=list(self.affected_services),
+            recommended_actions=list(self.recommended_actions),
+            assigned_team=self.assigned_team,
+            runbook_url=self.runbook_url,
+            priority=self.priority,
+        )
+
+
+class PlanCache:
+    """Least-recently-used map from alert fingerprint to triage template.
+    
+    Bounded so a long-running process that sees many distinct resources
+    keeps only the ``maxsize`` most recently used plans.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Fingerprint, TriageTemplate] = OrderedDict()
+    
+    def get(self, key: Fingerprint) -> TriageTemplate | None:
+        template = self._entries.get(key)
+        if template is not None:
+            self._entries.move_to_end(key)
+        return template
+    
+    def put(self, key: Fingerprint, template: TriageTemplate) -> None:
+        self._entries[key] = template
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Only auto-approved (sev3/sev4) triages are stored; sev1/sev2 always go
+# through human review.
+plan_cache = PlanCache(maxsize=1024)
+
+
+def summarize_alert(alert: ProcessedAlert) -> str:
+    """Build the triage summary line for an alert."""
+    elevated = ', '.join(alert.elevated_metrics)
+    return f"{alert.description}. Resource: {alert.resource}. Current metrics show elevated {elevated}."
+
+
 class TriageApproval(BaseModel):
     """Human approval for triage classification."""
     
@@ -119,7 +262,7 @@ class TriageApproval(BaseModel):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubIssue:
     """Created GitHub issue details."""
     triage: TriageResult
@@ -129,17 +272,17 @@ class GitHubIssue:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamsNotification:
     """Teams notification result."""
-    github_issue: GitHubIssue
+    triage: TriageResult
     channel: str
     message_id: str
     posted_at: str
     success: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class IncidentReport:
     """Final incident report."""
     incident_id: str
@@ -157,16 +300,21 @@ class IncidentReport:
 class AlertProcessor(Executor):
     """Step 1: Receives and validates incoming alerts."""
     
-    @handler
-    async def process_alert(self, alert: AlertInput, ctx: WorkflowContext[ProcessedAlert]) -> None:
+    @staticmethod
+    def validate(alert: AlertInput) -> ProcessedAlert:
         """Validate and enrich the incoming alert."""
-        await asyncio.sleep(0.5)  # Simulate processing
-        
         # Parse metrics JSON
         try:
-            metrics = json.loads(alert.metrics) if isinstance(alert.metrics, str) else alert.metrics
-        except json.JSONDecodeError:
-            metrics = {}
+            metrics = orjson.loads(alert.metrics) if isinstance(alert.metrics, (bytes, str)) else alert.metrics
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which monitoring payloads do emit
+            try:
+                metrics = json.loads(alert.metrics)
+            except json.JSONDecodeError:
+                metrics = {}
+        
+        # Single pass over the metrics for every threshold triage looks at
+        elevated_metrics = [k for k, v in metrics.items() if isinstance(v, (int, float)) and v > 80]
         
         validation_errors = []
         
@@ -178,7 +326,11 @@ class AlertProcessor(Executor):
         if alert.severity not in ["critical", "high", "medium", "low"]:
             validation_errors.append(f"Invalid severity: {alert.severity}")
         
-        processed = ProcessedAlert(
+        cpu_high = metrics.get("cpu_percent", 0) > 90
+        memory_high = metrics.get("memory_percent", 0) > 85
+        runbook_key = IncidentTriageExecutor.match_runbook(alert.title, alert.description)
+        
+        return ProcessedAlert(
             alert_id=alert.alert_id,
             title=alert.title,
             severity=alert.severity,
@@ -188,8 +340,30 @@ class AlertProcessor(Executor):
             metrics=metrics,
             received_at=datetime.now().isoformat(),
             is_valid=len(validation_errors) == 0,
-            validation_errors=validation_errors
+            validation_errors=validation_errors,
+            cpu_high=cpu_high,
+            memory_high=memory_high,
+            elevated_metrics=elevated_metrics,
+            runbook_key=runbook_key,
+            fingerprint=(alert.resource, alert.severity, runbook_key, cpu_high, memory_high),
         )
+    
+    @handler
+    async def process_alert(
+        self,
+        alert: AlertInput,
+        ctx: WorkflowContext[ProcessedAlert | TriageResult]
+    ) -> None:
+        """Validate the alert and forward it, or its cached triage."""
+        await simulate_work(0.5)  # Simulate processing
+        
+        processed = self.validate(alert)
+        
+        # Repeat alerts reuse a cached triage and bypass IncidentTriageExecutor
+        cached = IncidentTriageExecutor.lookup_cached(processed)
+        if cached is not None:
+            await ctx.send_message(cached)
+            return
         
         await ctx.send_message(processed)
 
@@ -214,34 +388,49 @@ class IncidentTriageExecutor(Executor):
         "default": "https://wiki.contoso.com/runbooks/general-triage",
     }
     
-    @handler
-    async def triage_alert(self, alert: ProcessedAlert, ctx: WorkflowContext[TriageResult]) -> None:
+    # Precompiled matchers, checked in table order so the first entry wins
+    _pick_team = staticmethod(compile_team_picker(SERVICE_TEAMS, "platform-sre-team"))
+    _RUNBOOK_KEYWORDS = tuple(k for k in RUNBOOKS if k != "default")
+    
+    @classmethod
+    def match_team(cls, alert: ProcessedAlert) -> str:
+        """Return the team owning the alert's resource."""
+        return cls._pick_team(alert.resource)
+    
+    @classmethod
+    def match_runbook(cls, title: str, description: str) -> str:
+        """Return the RUNBOOKS key that applies to an alert's title and description."""
+        text = f"{title} {description}".lower()
+        return next((k for k in cls._RUNBOOK_KEYWORDS if k in text), "default")
+    
+    @staticmethod
+    def lookup_cached(alert: ProcessedAlert) -> TriageResult | None:
+        """Return a triage built from the plan cache, or None on a miss."""
+        if not alert.is_valid:
+            return None
+        template = plan_cache.get(alert.fingerprint)
+        return template.fill(alert) if template is not None else None
+    
+    @staticmethod
+    def remember(triage: TriageResult) -> None:
+        """Store a final, auto-approved triage in the plan cache for repeat alerts."""
+        if triage.alert.is_valid:
+            plan_cache.put(triage.alert.fingerprint, TriageTemplate.from_triage(triage))
+    
+    @staticmethod
+    def needs_approval(triage: TriageResult) -> bool:
+        """Whether the triage must be reviewed by a human before proceeding."""
+        return triage.incident_severity in ["sev1", "sev2"]
+    
+    @classmethod
+    def classify(cls, alert: ProcessedAlert) -> TriageResult:
         """Analyze the alert and determine incident classification."""
-        await asyncio.sleep(1.0)  # Simulate analysis
-        
         # Map alert severity to incident severity
-        severity_map = {
-            "critical": "sev1",
-            "high": "sev2",
-            "medium": "sev3",
-            "low": "sev4"
-        }
-        incident_severity = severity_map.get(alert.severity, "sev3")
-        
-        # Determine priority
-        priority_map = {
-            "sev1": "P1",
-            "sev2": "P2",
-            "sev3": "P3",
-            "sev4": "P4"
-        }
+        sev = _FROM_ALERT.get(alert.severity, Sev.SEV3)
+        incident_severity = _SEV_LABEL[sev]
         
         # Find assigned team based on resource name
-        assigned_team = "platform-sre-team"  # default
-        for prefix, team in self.SERVICE_TEAMS.items():
-            if alert.resource.startswith(prefix):
-                assigned_team = team
-                break
+        assigned_team = cls.match_team(alert)
         
         # Determine affected services based on resource
         affected_services = []
@@ -255,20 +444,15 @@ class IncidentTriageExecutor(Executor):
             affected_services = [alert.resource]
         
         # Get appropriate runbook
-        runbook_url = self.RUNBOOKS["default"]
-        for keyword, url in self.RUNBOOKS.items():
-            if keyword in alert.title.lower() or keyword in alert.description.lower():
-                runbook_url = url
-                break
+        runbook_url = cls.RUNBOOKS[alert.runbook_key]
         
         # Generate recommended actions
         recommended_actions = []
-        metrics = alert.metrics
         
-        if metrics.get("cpu_percent", 0) > 90:
+        if alert.cpu_high:
             recommended_actions.append("Check for runaway processes")
             recommended_actions.append("Consider scaling up or out")
-        if metrics.get("memory_percent", 0) > 85:
+        if alert.memory_high:
             recommended_actions.append("Identify memory-intensive queries")
             recommended_actions.append("Check for memory leaks")
         if not recommended_actions:
@@ -279,21 +463,42 @@ class IncidentTriageExecutor(Executor):
             alert=alert,
             incident_severity=incident_severity,
             incident_title=f"[{incident_severity.upper()}] {alert.title}",
-            summary=f"{alert.description}. Resource: {alert.resource}. Current metrics show elevated {', '.join(k for k, v in metrics.items() if isinstance(v, (int, float)) and v > 80)}.",
+            summary=summarize_alert(alert),
             affected_services=affected_services,
             recommended_actions=recommended_actions,
             assigned_team=assigned_team,
             runbook_url=runbook_url,
-            priority=priority_map[incident_severity]
+            priority=_PRIORITY[sev]
         )
         
+        return triage
+    
+    @staticmethod
+    def apply_approval(triage: TriageResult, response: TriageApproval) -> TriageResult:
+        """Update the triage with any severity override from the reviewer."""
+        if response.approved.startswith("override"):
+            new_severity = response.approved.split()[-1]  # e.g., "override to sev2" -> "sev2"
+            triage.incident_severity = new_severity
+            triage.incident_title = f"[{new_severity.upper()}] {triage.alert.title}"
+            triage.priority = _PRIORITY[_FROM_LABEL[new_severity]]
+        return triage
+    
+    @handler
+    async def triage_alert(self, alert: ProcessedAlert, ctx: WorkflowContext[TriageResult]) -> None:
+        """Classify the alert, pausing for review on sev1/sev2 incidents."""
+        await simulate_work(1.0)  # Simulate analysis
+        
+        triage = self.classify(alert)
+        
         # Request human approval for sev1/sev2 incidents
-        if incident_severity in ["sev1", "sev2"]:
+        if self.needs_approval(triage):
             await ctx.request_info(
                 request_data=triage,
                 response_type=TriageApproval,
             )
         else:
+            # Only auto-approved triages are reused for later alerts
+            self.remember(triage)
             await ctx.send_message(triage)
     
     @response_handler
@@ -304,28 +509,19 @@ class IncidentTriageExecutor(Executor):
         ctx: WorkflowContext[TriageResult]
     ) -> None:
         """Process human approval and update triage if needed."""
-        triage = original_triage
-        
-        # Handle severity overrides
-        if response.approved.startswith("override"):
-            new_severity = response.approved.split()[-1]  # e.g., "override to sev2" -> "sev2"
-            triage.incident_severity = new_severity
-            triage.incident_title = f"[{new_severity.upper()}] {triage.alert.title}"
-            triage.priority = {"sev1": "P1", "sev2": "P2", "sev3": "P3"}[new_severity]
-        
-        await ctx.send_message(triage)
+        await ctx.send_message(self.apply_approval(original_triage, response))
 
 
 class GitHubIssueCreator(Executor):
     """Step 3: Creates a GitHub issue for incident tracking (simulated)."""
     
-    @handler
-    async def create_issue(self, triage: TriageResult, ctx: WorkflowContext[GitHubIssue]) -> None:
+    @staticmethod
+    async def post_issue(triage: TriageResult) -> GitHubIssue:
         """Create a GitHub issue for the incident."""
-        await asyncio.sleep(1.5)  # Simulate API call
+        await simulate_work(1.5)  # Simulate API call
         
         # Simulate issue creation (in production, use GitHub MCP)
-        issue_number = hash(triage.alert.alert_id) % 10000 + 1000
+        issue_number = next(_ISSUE_COUNTER)
         
         labels = [
             f"severity:{triage.incident_severity}",
@@ -334,135 +530,244 @@ class GitHubIssueCreator(Executor):
             triage.assigned_team,
         ]
         
-        issue = GitHubIssue(
+        return GitHubIssue(
             triage=triage,
             issue_number=issue_number,
             issue_url=f"https://github.com/contoso/incidents/issues/{issue_number}",
             labels=labels,
-            created_at=datetime.now().isoformat()
+            created_at=triage.alert.received_at  # One timestamp per incident
         )
-        
-        await ctx.send_message(issue)
+    
+    @handler
+    async def create_issue(self, triage: TriageResult, ctx: WorkflowContext[GitHubIssue]) -> None:
+        """Create a GitHub issue for the incident."""
+        await ctx.send_message(await self.post_issue(triage))
 
 
 class TeamsNotifier(Executor):
-    """Step 4: Posts notification to Teams channel (simulated)."""
+    """Step 4: Posts notification to Teams channel (simulated).
     
-    @handler
-    async def notify_teams(self, issue: GitHubIssue, ctx: WorkflowContext[TeamsNotification]) -> None:
+    Only needs the triage, so it runs concurrently with GitHubIssueCreator.
+    """
+    
+    @staticmethod
+    async def post_notification(triage: TriageResult) -> TeamsNotification:
         """Post an incident notification to Teams."""
-        await asyncio.sleep(1.0)  # Simulate API call
+        await simulate_work(1.0)  # Simulate API call
         
         # Determine channel based on severity
-        channel_map = {
-            "sev1": "#incident-critical",
-            "sev2": "#incident-high",
-            "sev3": "#ops-alerts",
-            "sev4": "#ops-info"
-        }
-        channel = channel_map.get(issue.triage.incident_severity, "#ops-alerts")
+        sev = _FROM_LABEL.get(triage.incident_severity, Sev.SEV3)
+        channel = _CHANNEL[sev]
         
         # Simulate Teams notification (in production, use Teams MCP/webhook)
-        notification = TeamsNotification(
-            github_issue=issue,
+        return TeamsNotification(
+            triage=triage,
             channel=channel,
-            message_id=f"msg-{hash(issue.issue_url) % 100000}",
-            posted_at=datetime.now().isoformat(),
+            message_id=f"msg-{next(_MSG_COUNTER)}",
+            posted_at=triage.alert.received_at,
             success=True
         )
-        
-        await ctx.send_message(notification)
-
-
-class IncidentReporter(Executor):
-    """Step 5: Generates final incident report."""
     
     @handler
-    async def generate_report(
-        self, 
-        notification: TeamsNotification, 
-        ctx: WorkflowContext[Never, str]
-    ) -> None:
-        """Generate the final incident report."""
-        await asyncio.sleep(0.5)
-        
-        issue = notification.github_issue
-        triage = issue.triage
-        
-        # Build report
-        severity_emoji = {
-            "sev1": "🔴",
-            "sev2": "🟠", 
-            "sev3": "🟡",
-            "sev4": "🔵"
-        }
-        
-        emoji = severity_emoji.get(triage.incident_severity, "⚪")
-        
-        report = f"""
+    async def notify_teams(self, triage: TriageResult, ctx: WorkflowContext[TeamsNotification]) -> None:
+        """Post an incident notification to Teams."""
+        await ctx.send_message(await self.post_notification(triage))
+
+
+_REPORT_TEMPLATE = """\
 {emoji} INCIDENT RESPONSE COMPLETE {emoji}
 ════════════════════════════════════════
 
-📋 Incident: {triage.incident_title}
-🎫 Ticket: #{issue.issue_number}
-🔗 GitHub: {issue.issue_url}
+📋 Incident: {incident_title}
+🎫 Ticket: #{issue_number}
+🔗 GitHub: {issue_url}
 
 📊 Classification:
-   • Severity: {triage.incident_severity.upper()}
-   • Priority: {triage.priority}
-   • Assigned: {triage.assigned_team}
+   • Severity: {severity}
+   • Priority: {priority}
+   • Assigned: {assigned_team}
 
 ⚠️ Affected Services:
-   • {chr(10) + '   • '.join(triage.affected_services)}
+{services_block}
 
 📝 Summary:
-   {triage.summary}
+   {summary}
 
 ✅ Recommended Actions:
-   1. {chr(10) + '   2. '.join(triage.recommended_actions[:2]) if len(triage.recommended_actions) > 1 else triage.recommended_actions[0] if triage.recommended_actions else 'Review logs'}
+{actions_block}
 
-📚 Runbook: {triage.runbook_url}
+📚 Runbook: {runbook_url}
 
 💬 Teams Notification:
-   • Channel: {notification.channel}
-   • Status: {'✓ Posted' if notification.success else '✗ Failed'}
+   • Channel: {channel}
+   • Status: {status}
 
-════════════════════════════════════════
-        """.strip()
+════════════════════════════════════════"""
+
+
+class IncidentReporter(Executor):
+    """Step 5: Generates final incident report.
+    
+    Joins the results of the GitHub and Teams steps.
+    """
+    
+    @staticmethod
+    def render(issue: GitHubIssue, notification: TeamsNotification) -> str:
+        """Render the final incident report."""
+        triage = issue.triage
+        
+        # Build report
+        sev = _FROM_LABEL.get(triage.incident_severity)
+        emoji = _EMOJI[sev] if sev is not None else "⚪"
+        
+        # Bullet and numbered lists are joined up front, then filled in one pass
+        services_block = "\n".join(f"   • {service}" for service in triage.affected_services)
+        actions = triage.recommended_actions[:2] or ["Review logs"]
+        actions_block = "\n".join(f"   {i}. {action}" for i, action in enumerate(actions, 1))
+        
+        return _REPORT_TEMPLATE.format_map({
+            "emoji": emoji,
+            "incident_title": triage.incident_title,
+            "issue_number": issue.issue_number,
+            "issue_url": issue.issue_url,
+            "severity": triage.incident_severity.upper(),
+            "priority": triage.priority,
+            "assigned_team": triage.assigned_team,
+            "services_block": services_block,
+            "summary": triage.summary,
+            "actions_block": actions_block,
+            "runbook_url": triage.runbook_url,
+            "channel": notification.channel,
+            "status": "✓ Posted" if notification.success else "✗ Failed",
+        })
+    
+    @handler
+    async def generate_report(
+        self, 
+        results: list[GitHubIssue | TeamsNotification], 
+        ctx: WorkflowContext[Never, str]
+    ) -> None:
+        """Generate the final incident report."""
+        await simulate_work(0.5)
+        issue = next(r for r in results if isinstance(r, GitHubIssue))
+        notification = next(r for r in results if isinstance(r, TeamsNotification))
+        await ctx.yield_output(self.render(issue, notification))
+
+
+class FusedIncidentPipeline(Executor):
+    """All five steps in one executor, without message hops between them.
+    
+    Running the steps in a single handler gives the same result as the
+    step-wise workflow, with the GitHub and Teams calls awaited concurrently.
+    The only pause point is human approval for sev1/sev2 incidents.
+    """
+    
+    # Step logic shared with the step-wise executors
+    _validate = staticmethod(AlertProcessor.validate)
+    _create_issue = staticmethod(GitHubIssueCreator.post_issue)
+    _notify = staticmethod(TeamsNotifier.post_notification)
+    _report = staticmethod(IncidentReporter.render)
+    
+    @handler
+    async def run_pipeline(
+        self,
+        alert: AlertInput,
+        ctx: WorkflowContext[Never, str]
+    ) -> None:
+        """Validate and triage the alert, then finish unless review is needed."""
+        await simulate_work(0.5)  # Simulate processing
+        processed = self._validate(alert)
+        
+        triage = IncidentTriageExecutor.lookup_cached(processed)
+        if triage is None:
+            await simulate_work(1.0)  # Simulate analysis
+            triage = IncidentTriageExecutor.classify(processed)
+            
+            # Request human approval for sev1/sev2 incidents
+            if IncidentTriageExecutor.needs_approval(triage):
+                await ctx.request_info(
+                    request_data=triage,
+                    response_type=TriageApproval,
+                )
+                return
+            
+            # Only auto-approved triages are reused for later alerts
+            IncidentTriageExecutor.remember(triage)
         
-        await ctx.yield_output(report)
+        await self._respond(triage, ctx)
+    
+    @response_handler
+    async def handle_approval(
+        self,
+        original_triage: TriageResult,
+        response: TriageApproval,
+        ctx: WorkflowContext[Never, str]
+    ) -> None:
+        """Apply the reviewer's decision and finish the pipeline."""
+        triage = IncidentTriageExecutor.apply_approval(original_triage, response)
+        await self._respond(triage, ctx)
+    
+    async def _respond(self, triage: TriageResult, ctx: WorkflowContext[Never, str]) -> None:
+        """Run the issue, notification and report steps for a triaged alert."""
+        # GitHub and Teams are independent, so wait on max() rather than sum()
+        issue, notification = await asyncio.gather(
+            self._create_issue(triage),
+            self._notify(triage),
+        )
+        await simulate_work(0.5)
+        await ctx.yield_output(self._report(issue, notification))
 
 
 # ============================================================================
 # Workflow Definition
 # ============================================================================
 
-# Create executors
-alert_processor = AlertProcessor(id="alert_processor")
-incident_triage = IncidentTriageExecutor(id="incident_triage")
-github_creator = GitHubIssueCreator(id="github_creator")
-teams_notifier = TeamsNotifier(id="teams_notifier")
-incident_reporter = IncidentReporter(id="incident_reporter")
-
-# Build the workflow
-workflow = (
-    WorkflowBuilder(
-        name="SRE Incident Response",
-        description="Automated incident triage with GitHub issue creation and Teams notifications"
-    )
-    .set_start_executor(alert_processor)
-    .add_edge(alert_processor, incident_triage)
-    .add_edge(incident_triage, github_creator)
-    .add_edge(github_creator, teams_notifier)
-    .add_edge(teams_notifier, incident_reporter)
-    .build()
+# Set WORKFLOW_DEBUG=1 to run each step as its own executor, so DevUI can
+# trace the messages passed between them. By default the steps are fused.
+WORKFLOW_DEBUG = os.getenv("WORKFLOW_DEBUG") == "1"
+
+builder = WorkflowBuilder(
+    name="SRE Incident Response",
+    description="Automated incident triage with GitHub issue creation and Teams notifications"
 )
 
+if WORKFLOW_DEBUG:
+    # Create executors
+    alert_processor = AlertProcessor(id="alert_processor")
+    incident_triage = IncidentTriageExecutor(id="incident_triage")
+    github_creator = GitHubIssueCreator(id="github_creator")
+    teams_notifier = TeamsNotifier(id="teams_notifier")
+    incident_reporter = IncidentReporter(id="incident_reporter")
+    
+    # Build the workflow
+    workflow = (
+        builder
+        .set_start_executor(alert_processor)
+        .add_edge(alert_processor, incident_triage)
+        # Plan cache hits skip triage
+        .add_fan_out_edges(alert_processor, [github_creator, teams_notifier])
+        # GitHub and Teams run concurrently, the reporter joins both
+        .add_fan_out_edges(incident_triage, [github_creator, teams_notifier])
+        .add_fan_in_edges([github_creator, teams_notifier], incident_reporter)
+        .build()
+    )
+else:
+    incident_pipeline = FusedIncidentPipeline(id="incident_pipeline")
+    workflow = builder.set_start_executor(incident_pipeline).build()
+
 
 def main():
     """Launch the SRE incident workflow in DevUI."""
     from agent_framework.devui import serve
     
+    # Optional: Set up OpenTelemetry tracing for AI Toolkit
+    # Uncomment the following lines if you have opentelemetry-exporter-otlp-proto-grpc installed
+    # from agent_framework.observability import configure_otel_providers
+    # configure_otel_providers(
+    #     vs_code_extension_port=4317,  # AI Toolkit gRPC port
+    #     enable_sensitive_data=True  # Enable capturing prompts and completions
+    # )
+    
     logging.basicConfig(level=logging.INFO, format="%(message)s")
     logger = logging.getLogger(__name__)
     